@@ -0,0 +1,7 @@
+from typing import Dict, Any, List
+class AvgReducer:
+    def run(self, inputs: List[Dict[str, Any]], seed: str) -> Dict[str, Any]:
+        # Length-weighted mean from the map-side partial sums
+        total = sum(int(x["gc_count"]) for x in inputs)
+        length = sum(int(x["len"]) for x in inputs)
+        return {"avg_gc": total / max(length, 1)}
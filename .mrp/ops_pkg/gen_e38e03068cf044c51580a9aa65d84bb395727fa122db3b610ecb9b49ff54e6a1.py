@@ -0,0 +1,101 @@
+# --- specialized constants ---
+PATTERN = 'GC'
+# Generated operator module (ephemeral)
+# PATTERN is baked in by the compiler from `constants`
+from typing import Any, Callable, Dict, List
+import numpy as np
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to str.count / NumPy scans
+    njit = None
+
+def _jit(fn, **opts):
+    try:
+        return njit(cache=True, **opts)(fn)
+    except RuntimeError:  # no cache locator, e.g. source exec'd inside a sandbox
+        return njit(**opts)(fn)
+
+def _fold_table(pattern: str) -> np.ndarray:
+    # Case-folded ASCII lookup table, frozen into the kernels as a constant
+    table = np.zeros(256, dtype=np.bool_)
+    for p in pattern:
+        table[ord(p) | 0x20] = True
+    return table
+
+def _make_kernel(pattern: str) -> Callable[[str], int]:
+    if njit is None:
+        chars = sorted({ch for p in pattern for ch in (p.upper(), p.lower())})
+
+        def count(seq: str) -> int:
+            # Count both cases in place: no upper()/encode copy of the sequence
+            return sum(seq.count(ch) for ch in chars)
+
+        return count
+    table = _fold_table(pattern)
+
+    def kernel(buf):
+        c = 0
+        for i in range(buf.shape[0]):
+            if table[buf[i] | 0x20]:
+                c += 1
+        return c
+
+    compiled = _jit(kernel, nogil=True)
+    # Compile at import for the read-only buffers frombuffer yields, not on the first shard
+    compiled(np.frombuffer(b"A", dtype=np.uint8))
+
+    def count(seq: str) -> int:
+        # Non-ASCII chars become one "?" byte each, never a match (same as the str.count path)
+        return int(compiled(np.frombuffer(seq.encode("ascii", "replace"), dtype=np.uint8)))
+
+    return count
+
+def _make_batch_kernel(pattern: str) -> Callable[[List[bytes]], np.ndarray]:
+    # All shards live in one contiguous buffer; shard i is buf[offsets[i]:offsets[i + 1]]
+    table = _fold_table(pattern)
+    if njit is None:
+        def kernel(buf, offsets, out):
+            hits = np.zeros(buf.shape[0] + 1, dtype=np.int64)
+            np.cumsum(table[buf | np.uint8(0x20)], out=hits[1:])
+            out[:] = hits[offsets[1:]] - hits[offsets[:-1]]
+    else:
+        def kernel(buf, offsets, out):
+            for i in prange(out.shape[0]):
+                c = 0
+                for j in range(offsets[i], offsets[i + 1]):
+                    if table[buf[j] | 0x20]:
+                        c += 1
+                out[i] = c
+
+        kernel = _jit(kernel, nogil=True, parallel=True)
+
+    def batch(seqs: List[bytes]) -> np.ndarray:
+        offsets = np.zeros(len(seqs) + 1, dtype=np.int64)
+        np.cumsum([len(s) for s in seqs], out=offsets[1:])
+        buf = np.frombuffer(b"".join(seqs), dtype=np.uint8)
+        out = np.empty(len(seqs), dtype=np.int64)
+        kernel(buf, offsets, out)
+        return out
+
+    batch([b"A"])
+    return batch
+
+_count_gc = _make_kernel(PATTERN)
+batch_gc = _make_batch_kernel(PATTERN)
+
+def _gc_record(shard_id: Any, gc_count: int, length: int) -> Dict[str, Any]:
+    # Emit partial sums so reducers can combine shards without re-reading sequences
+    return {"_shard_id": shard_id, "gc": gc_count / max(length, 1), "gc_count": gc_count, "len": length}
+
+class GCContentAgent:
+    cpu_bound = True
+    batchable = True
+
+    def run(self, params: Dict[str, Any], seed: str) -> Dict[str, Any]:
+        seq = params.get("seq", "")
+        return _gc_record(params.get("_shard_id", 0), _count_gc(seq) if seq else 0, len(seq))
+
+    def run_batch(self, params: List[Dict[str, Any]], seed: str) -> List[Dict[str, Any]]:
+        seqs = [p.get("seq", "").encode("ascii", "replace") for p in params]
+        counts = batch_gc(seqs)
+        return [_gc_record(p.get("_shard_id", 0), int(c), len(s)) for p, c, s in zip(params, counts, seqs)]
@@ -1,40 +1,73 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import json
-import statistics
-import pandas as pd
+from pathlib import Path
+import numpy as np
 import matplotlib
 
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
 
+# Upper bound on points sent to the coverage line plot
+PLOT_MAX_POINTS = 4096
+
+
+def _decimate_max(bins: np.ndarray, target: int = PLOT_MAX_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    # Max-pool contiguous bin groups so at most `target` points reach the line plot
+    n = bins.size
+    if n <= target:
+        return np.arange(n), bins
+    k = -(-n // target)
+    starts = np.arange(0, n, k)
+    return starts, np.maximum.reduceat(bins, starts)
+
+
 class GenomicsReducer:
     def run(self, inputs: List[Dict[str, Any]], seed: str) -> Dict[str, Any]:
-        shards_sorted = sorted(inputs, key=lambda x: x.get("bin_index_start", 0))
-        merged_bins: List[int] = []
+        # Order shards by bin_index_start with a stable C-side argsort over extracted keys
+        keys = np.fromiter((int(x.get("bin_index_start", 0)) for x in inputs), dtype=np.int64, count=len(inputs))
+        shards_sorted = [inputs[i] for i in np.argsort(keys, kind="stable")]
+        # Fold each shard into running aggregates; bins are only concatenated once for the median
+        chunks: List[np.ndarray] = []
+        bin_count = 0
+        coverage_sum = 0
+        covered_bins = 0
+        min_coverage = 0
+        max_coverage = 0
         total_reads = 0
         mapped_reads = 0
         total_variants = 0
         for shard in shards_sorted:
-            merged_bins.extend([int(v) for v in shard.get("coverage_bins", [])])
+            arr = np.asarray(shard.get("coverage_bins", []), dtype=np.int32)
+            if arr.size:
+                lo, hi = int(arr.min()), int(arr.max())
+                min_coverage = lo if not bin_count else min(min_coverage, lo)
+                max_coverage = hi if not bin_count else max(max_coverage, hi)
+                bin_count += int(arr.size)
+                coverage_sum += int(arr.sum(dtype=np.int64))
+                covered_bins += int(np.count_nonzero(arr > 0))
+                chunks.append(arr)
             total_reads += int(shard.get("total_reads", 0))
             mapped_reads += int(shard.get("mapped_reads", 0))
             total_variants += int(shard.get("variant_count", 0))
-        if not merged_bins:
+        merged_bins = np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int32)
+        if not bin_count:
             mean_coverage = 0.0
             median_coverage = 0.0
-            min_coverage = 0
-            max_coverage = 0
             coverage_breadth_pct = 0.0
         else:
-            mean_coverage = float(sum(merged_bins)) / float(len(merged_bins))
-            median_coverage = float(statistics.median(merged_bins))
-            min_coverage = int(min(merged_bins))
-            max_coverage = int(max(merged_bins))
-            coverage_breadth_pct = (sum(1 for v in merged_bins if v > 0) / float(len(merged_bins))) * 100.0
+            mean_coverage = float(coverage_sum) / float(bin_count)
+            # O(N) selection instead of a full sort
+            mid = bin_count // 2
+            if bin_count & 1:
+                median_coverage = float(np.partition(merged_bins, mid)[mid])
+            else:
+                part = np.partition(merged_bins, [mid - 1, mid])
+                median_coverage = 0.5 * (float(part[mid - 1]) + float(part[mid]))
+            coverage_breadth_pct = (covered_bins / float(bin_count)) * 100.0
         mapping_rate_pct = (float(mapped_reads) / float(total_reads) * 100.0) if total_reads else 0.0
         return {
-            "bins": merged_bins,
+            "bins": merged_bins.tolist(),
             "stats": {
                 "mean_coverage": mean_coverage,
                 "median_coverage": median_coverage,
@@ -51,26 +84,27 @@ class GenomicsReducer:
 
 class GenomicsReportProducer:
     def run(self, result: Dict[str, Any], seed: str) -> Dict[str, Any]:
-        bins: List[int] = [int(v) for v in result.get("bins", [])]
+        bins = np.asarray(result.get("bins", []), dtype=np.int32)
         stats: Dict[str, Any] = result.get("stats", {})
-        df = pd.DataFrame({"bin_index": list(range(len(bins))), "coverage": bins})
-        df.to_csv("genomics_bins.csv", index=False)
+        bin_index = np.arange(bins.size, dtype=np.int64)
+        np.savetxt("genomics_bins.csv", np.column_stack([bin_index, bins]), fmt="%d,%d", header="bin_index,coverage", comments="")
         # Multi-panel plot roughly inspired by the demo
         fig = plt.figure(figsize=(16, 12))
         gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
         fig.suptitle("Genomics Analysis Results (Binned)", fontsize=18, fontweight="bold")
         # Panel 1: coverage vs bin index
         ax1 = fig.add_subplot(gs[0, :])
-        ax1.plot(df["bin_index"], df["coverage"], linewidth=1.2, color="steelblue")
+        ax1.plot(*_decimate_max(bins), linewidth=1.2, color="steelblue")
         ax1.set_xlabel("Bin index")
         ax1.set_ylabel("Coverage")
         ax1.set_title("Coverage Across Bins")
-        if len(bins) > 0:
+        if bins.size > 0:
             ax1.axhline(stats.get("mean_coverage", 0.0), color="red", linestyle="--", alpha=0.7, label=f"Mean {stats.get('mean_coverage',0):.1f}")
             ax1.legend()
         # Panel 2: histogram
         ax2 = fig.add_subplot(gs[1, 0])
-        ax2.hist(df["coverage"], bins=50, color="lightcoral", edgecolor="black", alpha=0.8)
+        counts, edges = np.histogram(bins, bins=50)
+        ax2.bar(edges[:-1], counts, width=np.diff(edges), align="edge", color="lightcoral", edgecolor="black", alpha=0.8)
         ax2.set_title("Coverage Distribution")
         ax2.set_xlabel("Coverage")
         ax2.set_ylabel("Count")
@@ -91,33 +125,36 @@ class GenomicsReportProducer:
         fig.savefig("genomics_analysis_plots.png", dpi=200)
         fig.savefig("genomics_analysis_plots.pdf")
         plt.close(fig)
-        with open("genomics_summary.txt", "w") as f:
-            f.write(json.dumps(stats, indent=2))
-        # Machine-readable summary TSV
-        with open("analysis_summary.tsv", "w") as f:
-            f.write("metric\tvalue\tunit\n")
-            f.write(f"total_reads\t{int(stats.get('total_reads',0))}\treads\n")
-            f.write(f"mapped_reads\t{int(stats.get('mapped_reads',0))}\treads\n")
-            f.write(f"mapping_rate\t{float(stats.get('mapping_rate_pct',0.0)):.2f}\tpercent\n")
-            f.write(f"mean_coverage\t{float(stats.get('mean_coverage',0.0)):.2f}\tx\n")
-            f.write(f"median_coverage\t{float(stats.get('median_coverage',0.0)):.2f}\tx\n")
-            f.write(f"min_coverage\t{int(stats.get('min_coverage',0))}\tx\n")
-            f.write(f"max_coverage\t{int(stats.get('max_coverage',0))}\tx\n")
-            f.write(f"coverage_breadth\t{float(stats.get('coverage_breadth_pct',0.0)):.2f}\tpercent\n")
-            f.write(f"variant_count\t{int(stats.get('total_variants',0))}\tvariants\n")
+        Path("genomics_summary.txt").write_text(json.dumps(stats, indent=2))
+        # Machine-readable summary TSV, formatted up front and written in one call
+        tsv_rows = [
+            "metric\tvalue\tunit",
+            f"total_reads\t{int(stats.get('total_reads',0))}\treads",
+            f"mapped_reads\t{int(stats.get('mapped_reads',0))}\treads",
+            f"mapping_rate\t{float(stats.get('mapping_rate_pct',0.0)):.2f}\tpercent",
+            f"mean_coverage\t{float(stats.get('mean_coverage',0.0)):.2f}\tx",
+            f"median_coverage\t{float(stats.get('median_coverage',0.0)):.2f}\tx",
+            f"min_coverage\t{int(stats.get('min_coverage',0))}\tx",
+            f"max_coverage\t{int(stats.get('max_coverage',0))}\tx",
+            f"coverage_breadth\t{float(stats.get('coverage_breadth_pct',0.0)):.2f}\tpercent",
+            f"variant_count\t{int(stats.get('total_variants',0))}\tvariants",
+        ]
+        Path("analysis_summary.tsv").write_bytes(("\n".join(tsv_rows) + "\n").encode("ascii"))
         # Markdown report
-        with open("analysis_report.md", "w") as f:
-            f.write("# Genomics Analysis Report\n\n")
-            f.write("## Summary Metrics\n\n")
-            f.write("- Total reads: {:,}\n".format(int(stats.get("total_reads", 0))))
-            f.write("- Mapped reads: {:,}\n".format(int(stats.get("mapped_reads", 0))))
-            f.write("- Mapping rate: {:.2f}%\n".format(float(stats.get("mapping_rate_pct", 0.0))))
-            f.write("- Mean coverage: {:.2f}x\n".format(float(stats.get("mean_coverage", 0.0))))
-            f.write("- Median coverage: {:.2f}x\n".format(float(stats.get("median_coverage", 0.0))))
-            f.write("- Coverage breadth: {:.2f}%\n".format(float(stats.get("coverage_breadth_pct", 0.0))))
-            f.write("- Variants found: {}\n\n".format(int(stats.get("total_variants", 0))))
-            f.write("## Figures\n\n")
-            f.write("See: genomics_analysis_plots.png and genomics_analysis_plots.pdf\n")
+        report = [
+            "# Genomics Analysis Report\n\n",
+            "## Summary Metrics\n\n",
+            "- Total reads: {:,}\n".format(int(stats.get("total_reads", 0))),
+            "- Mapped reads: {:,}\n".format(int(stats.get("mapped_reads", 0))),
+            "- Mapping rate: {:.2f}%\n".format(float(stats.get("mapping_rate_pct", 0.0))),
+            "- Mean coverage: {:.2f}x\n".format(float(stats.get("mean_coverage", 0.0))),
+            "- Median coverage: {:.2f}x\n".format(float(stats.get("median_coverage", 0.0))),
+            "- Coverage breadth: {:.2f}%\n".format(float(stats.get("coverage_breadth_pct", 0.0))),
+            "- Variants found: {}\n\n".format(int(stats.get("total_variants", 0))),
+            "## Figures\n\n",
+            "See: genomics_analysis_plots.png and genomics_analysis_plots.pdf\n",
+        ]
+        Path("analysis_report.md").write_text("".join(report))
         result = dict(result)
         result["artifacts"] = {
             "bins_csv": "genomics_bins.csv",
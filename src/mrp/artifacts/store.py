@@ -1,3 +1,5 @@
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 from blake3 import blake3
@@ -5,23 +7,41 @@ import orjson
 
 
 ART_DIR = Path(".mrp/artifacts")
+# Process umask, read once at import (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 
 def ensure_dirs() -> None:
     ART_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def digest_json(obj: Any) -> str:
-    data = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+def digest_bytes(data: bytes) -> str:
     return blake3(data).hexdigest()
 
 
+def digest_json(obj: Any) -> str:
+    return digest_bytes(orjson.dumps(obj, option=orjson.OPT_SORT_KEYS))
+
+
 def put_json(obj: Any) -> str:
     ensure_dirs()
-    d = digest_json(obj)
+    # Serialize once; the same bytes are hashed and written
+    data = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    d = digest_bytes(data)
     p = ART_DIR / f"{d}.json"
     if not p.exists():
-        p.write_bytes(orjson.dumps(obj, option=orjson.OPT_SORT_KEYS))
+        # Unique temp file per writer so concurrent puts of the same digest don't collide
+        fd, tmp = tempfile.mkstemp(dir=ART_DIR, suffix=".tmp")
+        try:
+            # mkstemp creates 0600; restore the mode a plain write would get under the umask
+            os.fchmod(fd, 0o666 & ~_UMASK)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, p)
+        except BaseException:
+            os.unlink(tmp)
+            raise
     return d
 
 
@@ -1,4 +1,5 @@
 from typing import Dict, Any, List, Tuple
+import ast
 from blake3 import blake3
 from .dsl.schema import JobSpec, normalize_json
 from pathlib import Path
@@ -7,19 +8,66 @@ from .ir.model import IR, MapTask, ReduceTask, ProduceTask
 
 
 def derive_seed(job: JobSpec) -> str:
-    payload = normalize_json(
-        {
-            "dsl_version": job.version,
-            "job_id": job.job_id,
-            "map_shards": job.map.shards,
-            "operators": {
-                "map": job.map.operator,
-                "reduce": job.reduce.operator,
-                "produce": job.produce.operator,
-            },
-        }
+    # Stream shards into the hasher one at a time (in spec order) rather than
+    # serializing them all into a single payload
+    h = blake3(max_threads=blake3.AUTO)
+    h.update(
+        normalize_json(
+            {
+                "dsl_version": job.version,
+                "job_id": job.job_id,
+                "operators": {
+                    "map": job.map.operator,
+                    "reduce": job.reduce.operator,
+                    "produce": job.produce.operator,
+                },
+            }
+        )
     )
-    return blake3(payload).hexdigest()
+    h.update(b"|shards|")
+    for shard in job.map.shards:
+        h.update(normalize_json(shard))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+def _round_trips(literal: str, value: Any) -> bool:
+    # The baked source must evaluate back to the value without any imports
+    try:
+        return bool(ast.literal_eval(literal) == value)
+    except (ValueError, SyntaxError):
+        return False
+
+
+def specialize_source(code: str, constants: Dict[str, Any]) -> str:
+    # Bake constants in as module-level literals so the content digest (and any
+    # compiled-kernel cache keyed on the module) is specific to their values
+    if not constants:
+        return code
+    lines = ["# --- specialized constants ---"]
+    for name in sorted(constants):
+        assert re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name), f"invalid constant name {name!r}"
+        literal = repr(constants[name])
+        assert _round_trips(literal, constants[name]), f"constant {name!r} is not a plain literal: {literal}"
+        lines.append(f"{name} = {literal}")
+    # Insert after any module docstring and __future__ imports, which must stay first
+    insert_at = 0
+    for i, node in enumerate(ast.parse(code).body):
+        is_docstring = (
+            i == 0
+            and isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        )
+        is_future = isinstance(node, ast.ImportFrom) and node.module == "__future__"
+        if not (is_docstring or is_future):
+            break
+        insert_at = node.end_lineno or node.lineno
+    code_lines = code.splitlines(keepends=True)
+    head = "".join(code_lines[:insert_at])
+    if head and not head.endswith("\n"):
+        head += "\n"
+    return head + "\n".join(lines) + "\n" + "".join(code_lines[insert_at:])
 
 
 def compile_job(job: JobSpec) -> Tuple[IR, Dict[str, Any], Dict[str, Any]]:
@@ -30,7 +78,7 @@ def compile_job(job: JobSpec) -> Tuple[IR, Dict[str, Any], Dict[str, Any]]:
         if generated and generated.get("code") and generated.get("entrypoint"):
             ops_dir = Path(".mrp/ops_pkg")
             ops_dir.mkdir(parents=True, exist_ok=True)
-            code_bytes = generated["code"].encode("utf-8")
+            code_bytes = specialize_source(generated["code"], generated.get("constants") or {}).encode("utf-8")
             code_digest = blake3(code_bytes).hexdigest()
             # Write to a module file using digest as name
             module_name = f"gen_{code_digest}"
@@ -48,7 +96,10 @@ def compile_job(job: JobSpec) -> Tuple[IR, Dict[str, Any], Dict[str, Any]]:
         assert fallback_operator, f"{kind} must provide 'operator' or 'generated'"
         return fallback_operator
 
-    shards_sorted = sorted(job.map.shards, key=lambda s: blake3(normalize_json(s)).hexdigest())
+    # Canonical shard order by content digest; raw digest bytes sort the same as their hex form
+    keys = [(blake3(normalize_json(s)).digest(), i) for i, s in enumerate(job.map.shards)]
+    keys.sort()
+    shards_sorted = [job.map.shards[i] for _, i in keys]
     maps: List[MapTask] = [
         MapTask(operator=materialize_generated("map", job.map.generated.model_dump() if job.map.generated else None, job.map.operator), shard_id=i, params=shard)
         for i, shard in enumerate(shards_sorted)
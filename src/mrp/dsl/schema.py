@@ -7,6 +7,7 @@ import orjson
 class GeneratedOperator(BaseModel):
     code: str  # python source code string
     entrypoint: str  # module:Class inside the generated code
+    constants: Dict[str, Any] = Field(default_factory=dict)  # module-level literals baked into the code
 
 
 class MapSpec(BaseModel):
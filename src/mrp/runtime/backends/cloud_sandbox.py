@@ -1,11 +1,15 @@
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from queue import Queue
 from typing import Any, Dict, List
 from dotenv import load_dotenv
 from daytona import Daytona, DaytonaConfig
 import importlib.util
 import json as _json
+import orjson
 from ..local import _load
 from ...ir.model import IR
 from ...artifacts.store import put_json
@@ -23,6 +27,7 @@ def _require_daytona_key() -> str:
     return api_key
 
 
+@lru_cache(maxsize=32)
 def _resolve_module_source(mod_name: str) -> str:
     # Try .mrp/ops_pkg first
     if mod_name.startswith("ops_pkg."):
@@ -36,44 +41,85 @@ def _resolve_module_source(mod_name: str) -> str:
     return Path(spec.origin).read_text()
 
 
-def _daytona_remote_run(client: Daytona, entrypoint: str, payload: Any, seed: str) -> Dict[str, Any]:
-    # Build a self-contained code string that defines the class and executes it
-    mod_name, cls_name = entrypoint.split(":", 1)
+# Where the map operator module is persisted inside each pooled sandbox
+REMOTE_OP_DIR = "/tmp/mrp_op"
+REMOTE_OP_MODULE = "mrp_op"
+# Prefix of the stdout line carrying a shard's JSON result
+RESULT_SENTINEL = "<<MRP_RESULT>>"
+
+
+def _create_operator_sandbox(client: Daytona, entrypoint: str, pool: List[Any]) -> Any:
+    sandbox = client.create()
+    pool.append(sandbox)  # registered before setup so it is always cleaned up
+    # Upload the operator module once; shards then only ship their payload
+    mod_name = entrypoint.split(":", 1)[0]
     module_source = _resolve_module_source(mod_name)
-    payload_json = _json.dumps(payload)
-    code = f"""
+    setup = f"""
+import os
+os.makedirs({REMOTE_OP_DIR!r}, exist_ok=True)
+with open({REMOTE_OP_DIR + "/" + REMOTE_OP_MODULE + ".py"!r}, "w") as f:
+    f.write({module_source!r})
+"""
+    resp = sandbox.process.code_run(setup)
+    if getattr(resp, "exit_code", 1) != 0:
+        raise RuntimeError(f"Remote operator setup failed: {resp.exit_code} {getattr(resp, 'result', '')}")
+    return sandbox
+
+
+def _delete_sandboxes(sandboxes: List[Any], raise_errors: bool = True) -> None:
+    # Attempt every delete so one failure doesn't leak the rest. Errors are re-raised
+    # afterwards, unless another exception is already propagating (then just reported)
+    print(f"Deleting {len(sandboxes)} sandbox(es)")
+    errors: List[Exception] = []
+    for sandbox in sandboxes:
+        try:
+            sandbox.delete()
+        except Exception as e:
+            errors.append(e)
+    if errors and raise_errors:
+        raise errors[0]
+    for e in errors:
+        print(f"Sandbox delete failed: {e!r}", file=sys.stderr)
+
+
+@lru_cache(maxsize=32)
+def _remote_code_prefix(entrypoint: str) -> str:
+    # Shard-invariant part of the remote program: import the persisted operator class
+    cls_name = entrypoint.split(":", 1)[1]
+    return f"""
 import json
-# --- embedded module source start ---
-{module_source}
-# --- embedded module source end ---
-payload = json.loads({payload_json!r})
+import sys
+sys.path.insert(0, {REMOTE_OP_DIR!r})
+from {REMOTE_OP_MODULE} import {cls_name} as Cls
+"""
+
+
+def _daytona_remote_run(sandbox: Any, entrypoint: str, payload: Any, seed: str) -> Dict[str, Any]:
+    # Run one shard on a sandbox prepared by _create_operator_sandbox
+    payload_json = _json.dumps(payload)
+    code = _remote_code_prefix(entrypoint) + f"""payload = json.loads({payload_json!r})
 seed = {seed!r}
-Cls = eval({cls_name!r})
 out = Cls().run(payload, seed)
-print(json.dumps(out))
+print({RESULT_SENTINEL!r} + json.dumps(out))
 """
-    sandbox = client.create()
-    try:
-        resp = sandbox.process.code_run(code)
-        if getattr(resp, "exit_code", 1) != 0:
-            raise RuntimeError(f"Remote execution failed: {resp.exit_code} {getattr(resp, 'result', '')}")
-        text = str(resp.result)
-        # Parse the last JSON line to ignore any preceding prints
-        for line in reversed(text.splitlines()):
-            line = line.strip()
-            if not line:
-                continue
+    resp = sandbox.process.code_run(code)
+    if getattr(resp, "exit_code", 1) != 0:
+        raise RuntimeError(f"Remote execution failed: {resp.exit_code} {getattr(resp, 'result', '')}")
+    text = str(resp.result)
+    # The result is the last line starting with the sentinel; operator prints are skipped
+    # (and a sentinel inside the payload itself never starts a line)
+    for line in reversed(text.splitlines()):
+        if line.startswith(RESULT_SENTINEL):
+            payload_text = line[len(RESULT_SENTINEL):]
             try:
-                return _json.loads(line)
-            except Exception:
-                continue
-        raise RuntimeError(f"Remote execution did not yield JSON. Output head: {text[:200]}")
-    finally:
-        print("Deleting sandbox")
-        sandbox.delete()
+                return orjson.loads(payload_text)
+            except orjson.JSONDecodeError:
+                # stdlib json on the sandbox side emits NaN/Infinity, which orjson rejects
+                return _json.loads(payload_text)
+    raise RuntimeError(f"Remote execution did not yield JSON. Output head: {text[:200]}")
 
 
-def run_ir_cloud(ir: IR) -> Dict[str, Any]:
+def run_ir_cloud(ir: IR, max_workers: int | None = None) -> Dict[str, Any]:
     api_key = _require_daytona_key()
     # Ensure generated operators are importable
     ops_pkg_root = Path(".mrp").resolve()
@@ -87,11 +133,32 @@ def run_ir_cloud(ir: IR) -> Dict[str, Any]:
     reduce_entry = ir.manifest["operators"]["reduce"]
     produce_entry = ir.manifest["operators"]["produce"]
 
-    # Simulate remote maps (sequential for now; backend will parallelize later)
+    # Remote maps are I/O-bound (network round-trips), so overlap them on threads. Each
+    # thread borrows a warm sandbox from a pool provisioned once, instead of paying
+    # sandbox create/delete per shard.
+    workers = min(max_workers or 16, len(ir.maps))
+    created: List[Any] = []
+    idle: "Queue[Any]" = Queue()
     map_results: List[Dict[str, Any]] = []
-    for t in ir.maps:
-        out = _daytona_remote_run(client, map_entry, t.params, seed)
-        map_results.append(out)
+
+    def run_shard(params: Dict[str, Any]) -> Dict[str, Any]:
+        sandbox = idle.get()
+        try:
+            return _daytona_remote_run(sandbox, map_entry, params, seed)
+        finally:
+            idle.put(sandbox)
+
+    if workers:
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                for sandbox in ex.map(lambda _: _create_operator_sandbox(client, map_entry, created), range(workers)):
+                    idle.put(sandbox)
+                futs = [ex.submit(run_shard, t.params) for t in ir.maps]
+                map_results = [f.result() for f in futs]
+        except BaseException:
+            _delete_sandboxes(created, raise_errors=False)
+            raise
+        _delete_sandboxes(created)
 
     results_sorted = sorted(map_results, key=lambda r: r.get("_shard_id", 0))
     # Reduce locally per PRD (deterministic aggregation)
@@ -1,21 +1,47 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Dict, Any, List
 from ..ir.model import IR
 from ..artifacts.store import put_json
 import importlib
+import multiprocessing
 import sys
 from pathlib import Path
 from datetime import datetime
 import os
 
 
+@lru_cache(maxsize=None)
 def _load(path: str):
     mod_name, cls_name = path.rsplit(":", 1) if ":" in path else path.rsplit(".", 1)
     mod = importlib.import_module(mod_name)
     return getattr(mod, cls_name)
 
 
-def run_ir(ir: IR, max_workers: int | None = None) -> Dict[str, Any]:
+def _is_cpu_bound(cls: Any) -> bool:
+    return bool(getattr(cls, "cpu_bound", False))
+
+
+def _is_batchable(cls: Any) -> bool:
+    return bool(getattr(cls, "batchable", False))
+
+
+# Per-process map operator instance, set up once by _worker_init
+_worker_agent: Any = None
+
+
+def _worker_init(ops_pkg_root: str, entrypoint: str) -> None:
+    global _worker_agent
+    if ops_pkg_root not in sys.path:
+        sys.path.insert(0, ops_pkg_root)
+    _worker_agent = _load(entrypoint)()
+
+
+def _worker_run(params: Dict[str, Any], seed: str) -> Dict[str, Any]:
+    return _worker_agent.run(params, seed)
+
+
+def run_ir(ir: IR, max_workers: int | None = None, executor: str | None = None) -> Dict[str, Any]:
     # Ensure materialized generated operators are importable
     ops_pkg_root = Path(".mrp").resolve()
     if ops_pkg_root.exists():
@@ -23,17 +49,44 @@ def run_ir(ir: IR, max_workers: int | None = None) -> Dict[str, Any]:
         if root not in sys.path:
             sys.path.insert(0, root)
     seed = ir.manifest["seed"]
-    Agent = _load(ir.manifest["operators"]["map"])
+    map_entry = ir.manifest["operators"]["map"]
+    Agent = _load(map_entry)
     Reducer = _load(ir.manifest["operators"]["reduce"])
     Producer = _load(ir.manifest["operators"]["produce"])
 
-    agent = Agent()
+    # Batchable operators take every shard in one call (no per-shard dispatch). Otherwise
+    # CPU-bound operators hold the GIL, so fan them out to processes; the operator is
+    # imported once per worker and only shard params cross the process boundary
+    if executor is None:
+        if _is_batchable(Agent):
+            executor = "batch"
+        else:
+            executor = "process" if _is_cpu_bound(Agent) else "thread"
+    if executor not in ("thread", "process", "batch"):
+        raise ValueError(f"Unknown map executor {executor!r}; expected 'thread', 'process' or 'batch'")
     results: List[Dict[str, Any]] = []
 
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futs = {ex.submit(agent.run, t.params, seed): t.shard_id for t in ir.maps}
-        for fut in as_completed(futs):
-            results.append(fut.result())
+    if executor == "batch":
+        results.extend(Agent().run_batch([t.params for t in ir.maps], seed))
+    else:
+        ex: Executor
+        if executor == "process":
+            # spawn, not fork: operators may have started thread pools (e.g. Numba's
+            # parallel layer) that are not fork-safe
+            ex = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_worker_init,
+                initargs=(str(ops_pkg_root), map_entry),
+            )
+            run_shard = _worker_run
+        else:
+            ex = ThreadPoolExecutor(max_workers=max_workers)
+            run_shard = Agent().run
+        with ex:
+            futs = {ex.submit(run_shard, t.params, seed): t.shard_id for t in ir.maps}
+            for fut in as_completed(futs):
+                results.append(fut.result())
 
     results_sorted = sorted(results, key=lambda r: r.get("_shard_id", 0))
     reduce_out = Reducer().run(results_sorted, seed)
@@ -3,10 +3,18 @@ from typing import Any, Dict, List
 
 
 class AgentBase(ABC):
+    # Runtime hints: cpu_bound maps run in a process pool; batchable maps get all
+    # shards in a single run_batch call
+    cpu_bound: bool = False
+    batchable: bool = False
+
     @abstractmethod
     def run(self, params: Dict[str, Any], seed: str) -> Dict[str, Any]:
         ...
 
+    def run_batch(self, params: List[Dict[str, Any]], seed: str) -> List[Dict[str, Any]]:
+        return [self.run(p, seed) for p in params]
+
 
 class ReducerBase(ABC):
     @abstractmethod
@@ -0,0 +1,131 @@
+import dataclasses
+import math
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from mrp.compiler import compile_job
+from mrp.dsl.schema import load_yaml
+from mrp.runtime.backends import cloud_sandbox
+from mrp.runtime.backends.cloud_sandbox import _create_operator_sandbox, _daytona_remote_run, run_ir_cloud
+
+
+class FakeSandbox:
+    # Runs programs on the host, with the remote operator dir remapped to a private directory
+    def __init__(self, root: Path, fail_delete: bool = False) -> None:
+        self.process = self
+        self.root = root
+        self.fail_delete = fail_delete
+        self.deleted = False
+
+    def code_run(self, code: str) -> SimpleNamespace:
+        code = code.replace(cloud_sandbox.REMOTE_OP_DIR, str(self.root))
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        return SimpleNamespace(exit_code=proc.returncode, result=proc.stdout + proc.stderr)
+
+    def delete(self) -> None:
+        self.deleted = True
+        if self.fail_delete:
+            raise RuntimeError("delete failed")
+
+
+class FakeDaytona:
+    def __init__(self, root: Path, fail_delete: bool = False) -> None:
+        self.root = root
+        self.fail_delete = fail_delete
+        self.sandboxes: list[FakeSandbox] = []
+
+    def create(self) -> FakeSandbox:
+        sandbox = FakeSandbox(self.root / f"sandbox{len(self.sandboxes)}", self.fail_delete and not self.sandboxes)
+        self.sandboxes.append(sandbox)
+        return sandbox
+
+
+@pytest.fixture
+def fake_client(tmp_path, monkeypatch):
+    def install(**kwargs):
+        client = FakeDaytona(tmp_path, **kwargs)
+        monkeypatch.setenv("DAYTONA_API_KEY", "test")
+        monkeypatch.setattr(cloud_sandbox, "Daytona", lambda config: client)
+        return client
+
+    return install
+
+
+def test_remote_run_parses_operator_output(tmp_path):
+    pool: list[FakeSandbox] = []
+    client = FakeDaytona(tmp_path)
+    sandbox = _create_operator_sandbox(client, "examples.toy:UppercaseAgent", pool)
+    out = _daytona_remote_run(sandbox, "examples.toy:UppercaseAgent", {"_shard_id": 3, "text": "abc"}, "seed")
+    assert out == {"_shard_id": 3, "text": "ABC"}
+    assert pool == [sandbox]
+    # A sandbox that never received the module cannot run shards
+    with pytest.raises(RuntimeError):
+        _daytona_remote_run(client.create(), "examples.toy:UppercaseAgent", {"_shard_id": 3, "text": "abc"}, "seed")
+
+
+def test_remote_run_sentinel_inside_payload(tmp_path):
+    entrypoint = "examples.toy:UppercaseAgent"
+    sandbox = _create_operator_sandbox(FakeDaytona(tmp_path), entrypoint, [])
+    out = _daytona_remote_run(sandbox, entrypoint, {"_shard_id": 0, "text": "a<<mrp_result>>b"}, "seed")
+    assert out == {"_shard_id": 0, "text": "A<<MRP_RESULT>>B"}
+
+
+def test_remote_run_non_finite_floats(tmp_path, monkeypatch):
+    (tmp_path / "nan_op.py").write_text(
+        "class NanAgent:\n"
+        "    def run(self, params, seed):\n"
+        "        return {'_shard_id': params['_shard_id'], 'x': float('nan'), 'y': float('inf')}\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    sandbox = _create_operator_sandbox(FakeDaytona(tmp_path), "nan_op:NanAgent", [])
+    out = _daytona_remote_run(sandbox, "nan_op:NanAgent", {"_shard_id": 0}, "seed")
+    assert math.isnan(out["x"]) and out["y"] == math.inf
+
+
+def test_run_ir_cloud_with_fake_client(fake_client):
+    client = fake_client()
+    ir, _, _ = compile_job(load_yaml("examples/jobs/cloud_toy.yaml"))
+    record = run_ir_cloud(ir)["record"]
+    assert [m["text"] for m in record["maps"]] == ["FOO", "BAR"]
+    assert len(client.sandboxes) == len(ir.maps)
+    assert all(s.deleted for s in client.sandboxes)
+
+
+def test_run_ir_cloud_reuses_sandboxes(fake_client):
+    client = fake_client()
+    ir, _, _ = compile_job(load_yaml("examples/jobs/cloud_toy.yaml"))
+    record = run_ir_cloud(ir, max_workers=1)["record"]
+    assert [m["text"] for m in record["maps"]] == ["FOO", "BAR"]
+    assert len(client.sandboxes) == 1 and client.sandboxes[0].deleted
+
+
+def test_run_ir_cloud_pool_sized_to_shards(fake_client):
+    client = fake_client()
+    ir, _, _ = compile_job(load_yaml("examples/jobs/cloud_toy.yaml"))
+    run_ir_cloud(ir, max_workers=8)
+    assert len(client.sandboxes) == len(ir.maps)
+    run_ir_cloud(dataclasses.replace(ir, maps=[]))
+    assert len(client.sandboxes) == len(ir.maps)
+
+
+def test_run_ir_cloud_deletes_all_sandboxes_when_one_delete_fails(fake_client):
+    client = fake_client(fail_delete=True)
+    ir, _, _ = compile_job(load_yaml("examples/jobs/cloud_toy.yaml"))
+    with pytest.raises(RuntimeError, match="delete failed"):
+        run_ir_cloud(ir)
+    assert len(client.sandboxes) == 2
+    assert all(s.deleted for s in client.sandboxes)
+
+
+def test_run_ir_cloud_shard_error_not_masked_by_delete_error(fake_client, capsys):
+    client = fake_client(fail_delete=True)
+    ir, _, _ = compile_job(load_yaml("examples/jobs/cloud_toy.yaml"))
+    broken = [dataclasses.replace(t, params={"_shard_id": t.shard_id}) for t in ir.maps]  # no "text"
+    with pytest.raises(RuntimeError, match="Remote execution failed"):
+        run_ir_cloud(dataclasses.replace(ir, maps=broken))
+    assert all(s.deleted for s in client.sandboxes)
+    assert "delete failed" in capsys.readouterr().err
@@ -0,0 +1,30 @@
+import datetime
+
+import pytest
+
+from mrp.compiler import specialize_source
+
+
+def test_specialize_source_bakes_constants():
+    code = "def f():\n    return PATTERN\n"
+    assert specialize_source(code, {}) == code
+    src = specialize_source(code, {"PATTERN": "GC", "K": 3})
+    ns: dict = {}
+    exec(src, ns)
+    assert ns["f"]() == "GC" and ns["K"] == 3
+
+
+def test_specialize_source_rejects_non_literals():
+    code = "x = 1\n"
+    for value in (datetime.date(2020, 1, 1), float("nan")):
+        with pytest.raises(AssertionError):
+            specialize_source(code, {"X": value})
+
+
+def test_specialize_source_keeps_docstring_and_future_imports_first():
+    code = '"""Generated op."""\nfrom __future__ import annotations\n\ndef f() -> str:\n    return PATTERN\n'
+    src = specialize_source(code, {"PATTERN": "GC"})
+    ns: dict = {}
+    exec(compile(src, "gen.py", "exec"), ns)
+    assert ns["f"]() == "GC"
+    assert ns["__doc__"] == "Generated op."
@@ -1,6 +1,10 @@
+from pathlib import Path
+
+import pytest
+
 from mrp.dsl.schema import load_yaml
 from mrp.compiler import compile_job
-from mrp.runtime.local import run_ir
+from mrp.runtime.local import _load, run_ir
 from mrp.artifacts.store import digest_json
 
 
@@ -13,3 +17,43 @@ def test_toy_job_reproducible():
     assert digest_json(out1) == digest_json(out2)
 
 
+def test_generated_gc_job():
+    job = load_yaml("examples/jobs/generated.yaml")
+    ir, _, _ = compile_job(job)
+    out = run_ir(ir)["record"]
+    assert [m["gc"] for m in out["maps"]] == [0.5, 1.0]
+    assert [(m["gc_count"], m["len"]) for m in out["maps"]] == [(2, 4), (4, 4)]
+    assert out["reduce"]["avg_gc"] == 0.75
+
+
+def test_process_executor_matches_threads():
+    job = load_yaml("examples/jobs/toy.yaml")
+    ir, _, _ = compile_job(job)
+    threaded = run_ir(ir, executor="thread")["record"]
+    pooled = run_ir(ir, executor="process")["record"]
+    assert pooled["maps"] == threaded["maps"]
+    assert pooled["reduce"] == threaded["reduce"]
+
+
+def test_unknown_executor_rejected():
+    ir, _, _ = compile_job(load_yaml("examples/jobs/toy.yaml"))
+    with pytest.raises(ValueError):
+        run_ir(ir, executor="proces")
+
+
+def test_batched_map_matches_per_shard():
+    job = load_yaml("examples/jobs/generated.yaml")
+    ir, _, _ = compile_job(job)
+    batched = run_ir(ir)["record"]
+    per_shard = run_ir(ir, executor="process")["record"]
+    assert batched["maps"] == per_shard["maps"]
+    assert batched["reduce"] == per_shard["reduce"]
+
+
+def test_gc_agent_accepts_non_ascii(monkeypatch):
+    _, manifest, _ = compile_job(load_yaml("examples/jobs/generated.yaml"))
+    monkeypatch.syspath_prepend(str(Path(".mrp").resolve()))
+    agent = _load(manifest["operators"]["map"])()
+    params = [{"_shard_id": 0, "seq": "ATGCé"}]
+    assert agent.run(params[0], "seed") == {"_shard_id": 0, "gc": 0.4, "gc_count": 2, "len": 5}
+    assert agent.run_batch(params, "seed") == [agent.run(params[0], "seed")]
@@ -0,0 +1,32 @@
+from examples.genomics import GenomicsReducer, GenomicsReportProducer
+
+
+def test_genomics_reducer_stats():
+    inputs = [
+        {"_shard_id": 1, "bin_index_start": 3, "coverage_bins": [0, 7], "total_reads": 10, "mapped_reads": 9, "variant_count": 1},
+        {"_shard_id": 0, "bin_index_start": 0, "coverage_bins": [4, 2, 9], "total_reads": 10, "mapped_reads": 8, "variant_count": 0},
+    ]
+    out = GenomicsReducer().run(inputs, "seed")
+    assert out["bins"] == [4, 2, 9, 0, 7]
+    stats = out["stats"]
+    assert stats["mean_coverage"] == 4.4
+    assert stats["median_coverage"] == 4.0
+    assert (stats["min_coverage"], stats["max_coverage"]) == (0, 9)
+    assert stats["coverage_breadth_pct"] == 80.0
+    assert stats["mapping_rate_pct"] == 85.0
+    assert stats["total_variants"] == 1
+
+
+def test_genomics_reducer_empty():
+    stats = GenomicsReducer().run([], "seed")["stats"]
+    assert stats["median_coverage"] == 0.0
+    assert (stats["min_coverage"], stats["max_coverage"]) == (0, 0)
+
+
+def test_genomics_report_outputs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    reduced = GenomicsReducer().run([{"bin_index_start": 0, "coverage_bins": [3, 0, 5], "total_reads": 4, "mapped_reads": 4}], "seed")
+    out = GenomicsReportProducer().run(reduced, "seed")
+    for name in out["artifacts"].values():
+        assert (tmp_path / name).exists()
+    assert (tmp_path / "genomics_bins.csv").read_text() == "bin_index,coverage\n0,3\n1,0\n2,5\n"
@@ -0,0 +1,24 @@
+import stat
+from concurrent.futures import ThreadPoolExecutor
+
+from mrp.artifacts import store
+
+
+def test_concurrent_put_json_same_object(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "ART_DIR", tmp_path)
+    obj = {"maps": list(range(1000)), "reduce": {"ok": True}}
+    for _ in range(20):
+        for p in tmp_path.iterdir():
+            p.unlink()
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            digests = list(ex.map(lambda _: store.put_json(obj), range(8)))
+        assert len(set(digests)) == 1
+        assert [p.name for p in tmp_path.iterdir()] == [f"{digests[0]}.json"]
+        assert store.get_json(digests[0]) == obj
+
+
+def test_put_json_default_file_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "ART_DIR", tmp_path)
+    monkeypatch.setattr(store, "_UMASK", 0o022)
+    d = store.put_json({"a": 1})
+    assert stat.S_IMODE((tmp_path / f"{d}.json").stat().st_mode) == 0o644